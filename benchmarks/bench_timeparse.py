@@ -0,0 +1,36 @@
+"""
+컷 시간 파서 벤치마크: 기존 split 기반 파서 vs timeparse.
+
+    python benchmarks/bench_timeparse.py
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from legacy_timeparse import legacy_parse_cut_time_to_ts  # noqa: E402
+from timeparse import parse_cut_time_to_ts, parse_cut_times_to_ts  # noqa: E402
+
+N = 50_000
+INPUTS = ["21:30", "21:30:15", "2026-01-20 09:10", "2130", "21시30분", "10분전", "01-20 09:10"]
+
+
+def main():
+    print(f"{'input':<20}{'legacy us':>12}{'new us':>12}")
+    for text in INPUTS:
+        new = timeit.timeit(lambda: parse_cut_time_to_ts(text), number=N) / N * 1e6
+        if legacy_parse_cut_time_to_ts(text) is None:
+            old = "-"
+        else:
+            old = f"{timeit.timeit(lambda: legacy_parse_cut_time_to_ts(text), number=N) / N * 1e6:.2f}"
+        print(f"{text:<20}{old:>12}{new:>12.2f}")
+
+    batch = INPUTS * 1000
+    t = timeit.timeit(lambda: parse_cut_times_to_ts(batch), number=10) / 10
+    print(f"batch of {len(batch)}: {t * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
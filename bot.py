@@ -1,8 +1,13 @@
 import os
 import json
 import asyncio
+import contextvars
+import functools
+import io
+import itertools
 import time
-from typing import Dict, Any, Optional, Set
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Set, Tuple
 
 import discord
 from discord.ext import commands
@@ -12,7 +17,26 @@ import datetime
 import pytz
 
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from catalog import (
+    PANEL_ACTIONS,
+    button_custom_id,
+    button_label,
+    plan_catalog_change,
+    read_boss_catalog,
+)
+from feeds import SimpleHandler, build_feed_bodies, publish_feeds, select_feed_spawns
+from history import (
+    HIST_AUTO_MISS,
+    HIST_CUT,
+    HIST_MISS,
+    append_history,
+    classify_set,
+    compute_history_stats,
+)
+from spawnindex import SpawnIndex
+from timeparse import parse_cut_time_to_ts
 
 # -----------------------------
 # 기본 설정 / 유틸
@@ -70,75 +94,12 @@ def fmt_kst_only(ts: int) -> str:
     return dt.strftime("%m-%d %H:%M")
 
 
-def parse_cut_time_to_ts(text: str) -> Optional[int]:
-    """
-    /설정에서 '컷 시간'으로 쓰는 입력 파서.
-    - 'YYYY-MM-DD HH:MM(:SS)' : 해당 시각(KST)
-    - 'HH:MM(:SS)' : 가장 최근 발생한 시각(미래면 어제로 해석)
-    """
-    text = text.strip()
-
-    # YYYY-MM-DD HH:MM(:SS)
-    try:
-        if " " in text and "-" in text:
-            date_part, time_part = text.split(" ", 1)
-            y, m, d = map(int, date_part.split("-"))
-            tparts = list(map(int, time_part.split(":")))
-            if len(tparts) == 2:
-                hh, mm = tparts
-                ss = 0
-            elif len(tparts) == 3:
-                hh, mm, ss = tparts
-            else:
-                return None
-            dt = KST.localize(datetime.datetime(y, m, d, hh, mm, ss))
-            return int(dt.timestamp())
-    except Exception:
-        pass
-
-    # HH:MM(:SS) -> 가장 최근 발생한 시각
-    try:
-        if ":" in text and "-" not in text:
-            tparts = list(map(int, text.split(":")))
-            if len(tparts) == 2:
-                hh, mm = tparts
-                ss = 0
-            elif len(tparts) == 3:
-                hh, mm, ss = tparts
-            else:
-                return None
-
-            now = datetime.datetime.now(KST)
-            dt = KST.localize(datetime.datetime(now.year, now.month, now.day, hh, mm, ss))
-
-            if dt > now:
-                dt = dt - datetime.timedelta(days=1)
-
-            return int(dt.timestamp())
-    except Exception:
-        pass
-
-    return None
-
-
 # -----------------------------
-# 간단 웹 헬스체크 (OCI/Render 유지용)
+# 간단 웹 헬스체크 (OCI/Render 유지용) + 젠 타임라인 피드 (feeds.py)
 # -----------------------------
-class SimpleHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        self.send_response(200)
-        self.send_header("Content-type", "text/plain")
-        self.end_headers()
-        self.wfile.write(b"OK")
-
-    def do_HEAD(self):
-        self.send_response(200)
-        self.end_headers()
-
-
 def run_web():
     port = int(os.environ.get("PORT", 3000))
-    server = HTTPServer(("0.0.0.0", port), SimpleHandler)
+    server = ThreadingHTTPServer(("0.0.0.0", port), SimpleHandler)
     server.serve_forever()
 
 
@@ -189,7 +150,12 @@ PANEL_CHANNELS = {
 
 STATE_FILE = "boss_state.json"
 
-BOSSES: Dict[str, int] = {
+# 보스 목록(보스명 -> 리젠 시간(h)): BOSS_CONFIG_FILE 에서 읽고, 실행 중 변경되면 다시 적용합니다.
+# 파일이 없으면 기본 목록을 사용합니다.
+BOSS_CONFIG_FILE = os.getenv("BOSS_CONFIG_FILE", "bosses.json").strip()
+CATALOG_POLL_SEC = 5
+
+DEFAULT_BOSSES: Dict[str, int] = {
     "베지": 6,
     "멘지": 6,
     "부활": 6,
@@ -198,11 +164,170 @@ BOSSES: Dict[str, int] = {
     "인과율": 12,
 }
 
+
+# 다른 모듈 코드가 참조를 들고 있으므로 재로딩 시에도 같은 dict 를 제자리에서 갱신합니다.
+BOSSES: Dict[str, int] = read_boss_catalog(BOSS_CONFIG_FILE) or dict(DEFAULT_BOSSES)
+
 FIVE_MIN = 5 * 60
 
 # 자동 미입력(자동 멍) 유예시간: 2시간
 AUTO_UNHANDLED_SEC = 120 * 60
 
+# 컷/멍 기록 (append-only 고정폭 바이너리)
+HISTORY_FILE = "boss_history.bin"
+
+
+# -----------------------------
+# 트레이싱 (느린 처리 추적)
+# -----------------------------
+# TRACE_ENABLED=1 일 때만 동작합니다. 꺼져 있으면 trace/span 은 아무것도 하지 않는
+# 공용 객체를 돌려주고, traced 는 함수를 그대로 반환합니다.
+TRACE_ENABLED = os.getenv("TRACE_ENABLED", "").strip().lower() in ("1", "true", "yes", "on")
+TRACE_SLOW_MS = float(os.getenv("TRACE_SLOW_MS", "500").strip() or 500)
+TRACE_SLOW_FILE = os.getenv("TRACE_SLOW_FILE", "slow_trace.jsonl").strip()
+TRACE_BUFFER_SIZE = 200
+
+RECENT_TRACES: Deque[Dict[str, Any]] = deque(maxlen=TRACE_BUFFER_SIZE)
+_current_trace: contextvars.ContextVar[Optional["_Trace"]] = contextvars.ContextVar("current_trace", default=None)
+_trace_ids = itertools.count(1)
+
+
+def _emit_slow(record: Dict[str, Any]) -> None:
+    try:
+        with open(TRACE_SLOW_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except Exception as e:
+        print(f"[TRACE_ERROR] slow log write failed: {e}")
+
+
+class _NoopTrace:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_TRACE = _NoopTrace()
+
+
+class _Trace:
+    """인터랙션/알림 하나에 대한 루트 구간. 안쪽의 span 들이 여기에 기록됩니다."""
+
+    __slots__ = ("name", "trace_id", "attrs", "started_at", "t0", "spans", "done", "_token")
+
+    def __init__(self, name: str, attrs: Dict[str, Any]):
+        self.name = name
+        self.trace_id = next(_trace_ids)
+        self.attrs = attrs
+        self.spans: List[Tuple[str, float, float]] = []  # (이름, 시작 오프셋 ms, 소요 ms)
+        self.done = False
+
+    def __enter__(self):
+        self.started_at = time.time()
+        self.t0 = time.perf_counter()
+        self._token = _current_trace.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ms = (time.perf_counter() - self.t0) * 1000
+        self.done = True
+        _current_trace.reset(self._token)
+
+        record = {
+            "trace": self.trace_id,
+            "name": self.name,
+            "at": round(self.started_at, 3),
+            "ms": round(ms, 2),
+            "attrs": self.attrs,
+            "spans": [{"op": n, "start_ms": round(o, 2), "ms": round(d, 2)} for n, o, d in self.spans],
+        }
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+        RECENT_TRACES.append(record)
+
+        if ms >= TRACE_SLOW_MS:
+            _emit_slow({"trace": self.trace_id, "op": self.name, "ms": record["ms"], "at": record["at"], "attrs": self.attrs})
+        return False
+
+
+class _Span:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        ms = (end - self.t0) * 1000
+
+        tr = _current_trace.get()
+        # 끝난 트레이스를 물려받은 백그라운드 태스크(알람 등)에서는 독립 구간으로 취급
+        if tr is not None and tr.done:
+            tr = None
+        if tr is not None:
+            tr.spans.append((self.name, (self.t0 - tr.t0) * 1000, ms))
+
+        if ms >= TRACE_SLOW_MS:
+            _emit_slow({
+                "trace": tr.trace_id if tr is not None else None,
+                "root": tr.name if tr is not None else None,
+                "op": self.name,
+                "ms": round(ms, 2),
+                "at": round(time.time() - (end - self.t0), 3),
+            })
+        return False
+
+
+def trace(name: str, **attrs: Any):
+    """루트 트레이스 구간: with trace("alert.spawn", boss=...):"""
+    if not TRACE_ENABLED:
+        return _NOOP_TRACE
+    return _Trace(name, attrs)
+
+
+def span(name: str):
+    """현재 트레이스 안의 하위 구간: with span("save_state"):"""
+    if not TRACE_ENABLED:
+        return _NOOP_TRACE
+    return _Span(name)
+
+
+def trace_note(**attrs: Any) -> None:
+    """현재 트레이스에 속성(보스명/동작 등)을 덧붙입니다."""
+    if not TRACE_ENABLED:
+        return
+    tr = _current_trace.get()
+    if tr is not None and not tr.done:
+        tr.attrs.update(attrs)
+
+
+def traced(name: str):
+    """코루틴 전체를 루트 트레이스로 감싸는 데코레이터(슬래시 명령/버튼 콜백용)."""
+    def deco(func):
+        if not TRACE_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            attrs: Dict[str, Any] = {}
+            for a in args:
+                if isinstance(a, discord.Interaction):
+                    attrs["interaction"] = a.id
+                    break
+            with _Trace(name, attrs):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return deco
+
 
 # -----------------------------
 # 상태 저장/로드
@@ -266,43 +391,91 @@ def save_state(state: Dict[str, Any]) -> None:
     pm = state.get("panel_message_ids")
     if not isinstance(pm, dict):
         state["panel_message_ids"] = {k: None for k in PANEL_CHANNELS.keys()}
-    with open(STATE_FILE, "w", encoding="utf-8") as f:
+    with span("save_state"), open(STATE_FILE, "w", encoding="utf-8") as f:
         json.dump(state, f, ensure_ascii=False, indent=2)
 
 
+# -----------------------------
+# 컷/멍 기록 통계 (기록/집계는 history.py)
+# -----------------------------
+def render_history_stats(stats: Dict[str, Any], days: int) -> str:
+    lines = [f"**최근 {days}일 통계** (기록 {stats['rows']}건)"]
+    if stats.get("truncated"):
+        lines[0] += " - 기록이 많아 최근 기록만 집계했습니다"
+    if not stats["bosses"]:
+        lines.append("- 기록 없음")
+        return "\n".join(lines)
+
+    def mins(sec: int) -> str:
+        return f"{sec / 60:+.0f}분"
+
+    for name in BOSSES.keys():
+        b = stats["bosses"].get(name)
+        if b is None:
+            continue
+        line = f"- {name}: 컷 {b['cut']} / 멍 {b['miss']} / 자동멍 {b['auto_miss']} | 멍 비율 {b['miss_rate'] * 100:.0f}%"
+        d = b["delay"]
+        if d:
+            line += f" | 컷 지연 중앙 {mins(d['median'])} (p10 {mins(d['p10'])}, p90 {mins(d['p90'])})"
+        lines.append(line)
+
+    members = list(stats["members"].items())[:10]
+    if members:
+        lines.append("")
+        lines.append("**참여 상위**")
+        for uid, n in members:
+            lines.append(f"- <@{uid}>: {n}회")
+
+    return "\n".join(lines)
+
+
 # -----------------------------
 # 패널 렌더링
 # -----------------------------
-def render_panel_text_compact(state: Dict[str, Any]) -> str:
-    lines = ["**현재 다음 젠 시간**"]
+def render_boss_line(name: str, b: Dict[str, Any]) -> str:
+    hours = BOSSES[name]
+    ns = b.get("next_spawn")
+    mc = int(b.get("miss_count", 0) or 0)
+
+    if isinstance(ns, int) and ns > 0:
+        tail = f" | 미입력 {mc}회" if mc > 0 else ""
+        return f"- {name} ({hours}h): {fmt_kst_rel(ns)}{tail}"
+
+    # ✅ 미등록이면 미입력 표시하지 않음
+    return f"- {name} ({hours}h): 미등록"
+
+
+def render_spawn_lines(state: Dict[str, Any], index: Optional[SpawnIndex] = None) -> List[str]:
+    """index 가 있으면 등록된 보스를 젠 시간순으로, 미등록은 한 줄로 묶어서 보여줍니다."""
     bosses_data = state["bosses"]
 
-    for name, hours in BOSSES.items():
-        b = bosses_data[name]
-        ns = b.get("next_spawn")
-        mc = int(b.get("miss_count", 0) or 0)
+    if index is None:
+        return [render_boss_line(name, bosses_data[name]) for name in BOSSES.keys()]
 
-        if isinstance(ns, int) and ns > 0:
-            tail = f" | 미입력 {mc}회" if mc > 0 else ""
-            lines.append(f"- {name} ({hours}h): {fmt_kst_rel(ns)}{tail}")
-        else:
-            # ✅ 미등록이면 미입력 표시하지 않음
-            lines.append(f"- {name} ({hours}h): 미등록")
+    lines = [render_boss_line(name, bosses_data[name]) for _, name in index.ordered()]
+    unregistered = [name for name in BOSSES.keys() if name not in index]
+    if unregistered:
+        lines.append(f"- 미등록: {', '.join(unregistered)}")
+    return lines
 
+
+def render_panel_text_compact(state: Dict[str, Any], index: Optional[SpawnIndex] = None) -> str:
+    lines = ["**현재 다음 젠 시간**"]
+    lines.extend(render_spawn_lines(state, index))
     return "\n".join(lines)
 
 
-def render_panel_text(state: Dict[str, Any]) -> str:
+def render_panel_text(state: Dict[str, Any], index: Optional[SpawnIndex] = None) -> str:
     lines = []
     lines.append("**보스 젠 관리 패널 (버튼: 컷 / 멍)**")
     lines.append("- 컷: 지금 잡힘(현재시간 기준으로 다음 젠 등록)")
     lines.append("- 멍: 미젠(기존 다음 젠 시간 기준으로 +리젠시간 연장)")
     lines.append("- 채팅 설정: `/설정 보스명 시간` (예: `/설정 베지 21:30` 또는 `/설정 베지 2026-01-20 09:10`)")
-    lines.append("- 확인: `/보탐`")
+    lines.append("- 확인: `/보탐` / 통계: `/통계`")
     lines.append("- 초기화: `/초기화 보스명` 또는 `/초기화전체`")
     lines.append("- 도움말: `/사용법`")
     lines.append("")
-    lines.append(render_panel_text_compact(state))
+    lines.append(render_panel_text_compact(state, index))
     return "\n".join(lines)
 
 
@@ -310,46 +483,65 @@ def render_panel_text(state: Dict[str, Any]) -> str:
 # UI: 패널 버튼
 # -----------------------------
 class BossPanelView(discord.ui.View):
+    # 디스코드 메시지 하나당 버튼 최대 25개 (보스당 컷/멍 2개)
+    MAX_ITEMS = 25
+
     def __init__(self, bot: commands.Bot):
         super().__init__(timeout=None)
         self.bot = bot
+        self.boss_buttons: Dict[str, List[discord.ui.Button]] = {}
 
-        row = 0
-        col = 0
+        for boss_name in BOSSES.keys():
+            self.add_boss(boss_name)
 
-        def next_row():
-            nonlocal row, col
-            row += 1
-            col = 0
+    def free_slots(self) -> int:
+        return self.MAX_ITEMS - len(self.children)
 
-        for boss_name in BOSSES.keys():
-            self.add_item(BossButton(bot, boss_name, action="컷", row=row))
-            col += 1
-            if col >= 5:
-                next_row()
+    def make_buttons(self, boss_name: str) -> List[discord.ui.Button]:
+        return [BossButton(self.bot, boss_name, action=a) for a in PANEL_ACTIONS]
 
-            self.add_item(BossButton(bot, boss_name, action="멍", row=row))
-            col += 1
-            if col >= 5:
-                next_row()
+    def attach_buttons(self, boss_name: str, buttons: List[discord.ui.Button]) -> None:
+        # row 를 지정하지 않으면 앞쪽 줄부터 빈 자리에 채워집니다.
+        for btn in buttons:
+            self.add_item(btn)
+        self.boss_buttons[boss_name] = buttons
+
+    def add_boss(self, boss_name: str) -> bool:
+        if boss_name in self.boss_buttons:
+            return True
+        if self.free_slots() < len(PANEL_ACTIONS):
+            print(f"[PANEL] 버튼 자리가 없어 {boss_name} 버튼을 추가하지 못했습니다. (/설정 은 사용 가능)")
+            return False
+        self.attach_buttons(boss_name, self.make_buttons(boss_name))
+        return True
+
+    def remove_boss(self, boss_name: str) -> None:
+        for btn in self.boss_buttons.pop(boss_name, []):
+            self.remove_item(btn)
 
 
 class BossButton(discord.ui.Button):
-    def __init__(self, bot: commands.Bot, boss_name: str, action: str, row: int):
+    def __init__(self, bot: commands.Bot, boss_name: str, action: str, row: Optional[int] = None):
         self.bot = bot
         self.boss_name = boss_name
         self.action = action
 
-        label = f"{boss_name} {action}"
+        label = button_label(boss_name, action)
         style = discord.ButtonStyle.success if action == "컷" else discord.ButtonStyle.secondary
-        custom_id = f"boss:{boss_name}:{action}"
+        custom_id = button_custom_id(boss_name, action)
         super().__init__(label=label, style=style, custom_id=custom_id, row=row)
 
+    @traced("panel.button")
     async def callback(self, interaction: discord.Interaction):
+        trace_note(boss=self.boss_name, action=self.action)
         if interaction.channel_id not in ALLOWED_CHANNEL_IDS:
             await interaction.response.send_message("이 버튼은 지정 채널에서만 사용됩니다.", ephemeral=True)
             return
 
+        if self.boss_name not in BOSSES:
+            await interaction.response.send_message("⚠️ 보스 목록에서 삭제된 보스입니다.", ephemeral=True)
+            return
+
         if not interaction.response.is_done():
             await interaction.response.defer(ephemeral=False)
 
@@ -365,6 +557,7 @@ class BossButton(discord.ui.Button):
             cur["next_spawn"] = base + interval_sec
             cur["miss_count"] = 0
             save_state(state)
+            append_history(HISTORY_FILE, self.boss_name, HIST_CUT, base, ns_before, interaction.user.id)
 
             await self.bot.reschedule_boss(self.boss_name)  # type: ignore[attr-defined]
             await self.bot.update_panel_message()           # type: ignore[attr-defined]
@@ -384,6 +577,7 @@ class BossButton(discord.ui.Button):
         cur["next_spawn"] = ns_before + interval_sec
         cur["miss_count"] = 0
         save_state(state)
+        append_history(HISTORY_FILE, self.boss_name, HIST_MISS, None, ns_before, interaction.user.id)
 
         await self.bot.reschedule_boss(self.boss_name)  # type: ignore[attr-defined]
         await self.bot.update_panel_message()           # type: ignore[attr-defined]
@@ -410,12 +604,17 @@ class SpawnAlertView(discord.ui.View):
     async def miss_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self._handle(interaction, action="멍")
 
+    @traced("alert.button")
     async def _handle(self, interaction: discord.Interaction, action: str):
+        trace_note(boss=self.boss_name, action=action)
         if interaction.channel_id not in ALLOWED_CHANNEL_IDS:
             await interaction.response.send_message("이 버튼은 지정 채널에서만 사용됩니다.", ephemeral=True)
             return
 
         boss = self.boss_name
+        if boss not in BOSSES:
+            await interaction.response.edit_message(content=f"🔔 **{boss}** 는 보스 목록에서 삭제되었습니다.", view=None)
+            return
         interval_sec = BOSSES[boss] * 3600
 
         state = self.bot.state_data  # type: ignore[attr-defined]
@@ -436,10 +635,12 @@ class SpawnAlertView(discord.ui.View):
             cur["last_cut"] = base
             next_spawn = base + interval_sec
             handled = "컷"
+            append_history(HISTORY_FILE, boss, HIST_CUT, base, self.target_ts, interaction.user.id)
         else:
             base = self.target_ts
             next_spawn = base + interval_sec
             handled = "멍"
+            append_history(HISTORY_FILE, boss, HIST_MISS, None, self.target_ts, interaction.user.id)
 
         cur["next_spawn"] = next_spawn
         cur["miss_count"] = 0
@@ -468,20 +669,112 @@ class BossBot(commands.Bot):
         super().__init__(command_prefix="!", intents=intents)
 
         self.state_data: Dict[str, Any] = load_state()
+        self.spawn_index = SpawnIndex.from_state(self.state_data)
         self.panel_view: Optional[BossPanelView] = None
         self.alarm_tasks: Dict[str, asyncio.Task] = {}
+        self._feed_key: Optional[tuple] = None
+        self.refresh_feeds()
+        self._catalog_mtime = self._catalog_stat()
 
     async def setup_hook(self):
         self.panel_view = BossPanelView(self)
         self.add_view(self.panel_view)
         await self.tree.sync()
+        asyncio.create_task(self._watch_catalog())
+
+    # -----------------------------
+    # 보스 목록 핫 리로드
+    # -----------------------------
+    @staticmethod
+    def _catalog_stat() -> Optional[int]:
+        try:
+            return os.stat(BOSS_CONFIG_FILE).st_mtime_ns
+        except OSError:
+            return None
+
+    async def _watch_catalog(self):
+        while True:
+            await asyncio.sleep(CATALOG_POLL_SEC)
+
+            mtime = self._catalog_stat()
+            if mtime is None or mtime == self._catalog_mtime:
+                continue
+            self._catalog_mtime = mtime
+
+            catalog = read_boss_catalog(BOSS_CONFIG_FILE)
+            if catalog is None:
+                continue
+
+            try:
+                await self.apply_catalog(catalog)
+            except Exception as e:
+                print(f"[CATALOG_ERROR] apply failed: {e}")
+
+    async def apply_catalog(self, catalog: Dict[str, int]):
+        """
+        새 보스 목록을 현재 목록과 비교해서 바뀐 보스만 반영합니다.
+        - 추가/삭제: 해당 보스의 버튼/상태/알람만 추가·제거
+        - 리젠 시간 변경: 해당 보스만 다음 젠 재계산 + 재예약
+        나머지 보스의 알람/자동 멍 대기는 그대로 유지됩니다.
+        실패할 수 있는 준비(버튼 생성)를 먼저 끝낸 뒤에 BOSSES/상태/패널을 한 번에 바꿉니다.
+        """
+        bosses_data = self.state_data["bosses"]
+        plan = plan_catalog_change(dict(BOSSES), catalog, bosses_data)
+        if plan is None:
+            return
+
+        # 1) 준비: 여기서 실패하면 아무것도 바뀌지 않음
+        new_buttons: Dict[str, List[discord.ui.Button]] = {}
+        if self.panel_view is not None:
+            slots = self.panel_view.free_slots() + sum(
+                len(self.panel_view.boss_buttons.get(n, ())) for n in plan.removed
+            )
+            for name in plan.added:
+                if slots < len(PANEL_ACTIONS):
+                    print(f"[PANEL] 버튼 자리가 없어 {name} 버튼을 추가하지 못했습니다. (/설정 은 사용 가능)")
+                    continue
+                new_buttons[name] = self.panel_view.make_buttons(name)
+                slots -= len(PANEL_ACTIONS)
+
+        # 2) 적용: 메모리 상의 변경만
+        BOSSES.clear()
+        BOSSES.update(catalog)
+
+        for name in plan.removed:
+            t = self.alarm_tasks.pop(name, None)
+            if t and not t.done():
+                t.cancel()
+            self.spawn_index.discard(name)
+            bosses_data.pop(name, None)
+            if self.panel_view is not None:
+                self.panel_view.remove_boss(name)
+
+        for name in plan.added:
+            bosses_data[name] = {"next_spawn": None, "last_cut": None, "miss_count": 0}
+            if name in new_buttons:
+                self.panel_view.attach_buttons(name, new_buttons[name])  # type: ignore[union-attr]
+
+        for name, ns in plan.next_spawns.items():
+            bosses_data[name]["next_spawn"] = ns
+
+        # 3) 반영: 재예약/저장/패널
+        for name in plan.next_spawns:
+            await self.reschedule_boss(name)
+
+        save_state(self.state_data)
+
+        if (plan.added or plan.removed) and self.panel_view is not None:
+            self.add_view(self.panel_view)
+
+        await self.update_panel_message()
+        print(f"[CATALOG] 추가 {plan.added} / 삭제 {plan.removed} / 리젠 변경 {plan.changed}")
 
     async def on_ready(self):
         print(f"Logged in as: {self.user} (id: {self.user.id})")
 
         await self.ensure_panel_message()
 
-        for boss_name in BOSSES.keys():
+        for boss_name in list(BOSSES):
             await self.reschedule_boss(boss_name)
 
         await self.update_panel_message()
@@ -521,17 +814,32 @@ class BossBot(commands.Bot):
                 pm_ids[key] = None
                 save_state(self.state_data)
 
-        content = render_panel_text(self.state_data)
+        content = render_panel_text(self.state_data, self.spawn_index)
         msg = await channel.send(content=content, view=self.panel_view)  # type: ignore[attr-defined]
         pm_ids[key] = msg.id
         save_state(self.state_data)
 
+    def refresh_feeds(self):
+        """
+        젠 목록이 바뀐 경우에만 HTTP 피드(JSON/iCalendar)를 다시 만듭니다.
+        피드에는 아직 오지 않은 젠만 넣고, 젠 시각이 지나면 알람 태스크가 다시 호출합니다.
+        """
+        spawns = select_feed_spawns(self.spawn_index, now_ts())
+        bosses_data = self.state_data["bosses"]
+        key = tuple((ns, name, bosses_data[name].get("miss_count"), BOSSES[name]) for ns, name in spawns)
+        if key == self._feed_key:
+            return
+        self._feed_key = key
+        publish_feeds(build_feed_bodies(self.state_data, spawns, BOSSES, now_ts()))
+
     async def update_panel_message(self):
+        self.refresh_feeds()
+
         pm_ids = self.state_data.get("panel_message_ids")
         if not isinstance(pm_ids, dict):
             return
 
-        content = render_panel_text_compact(self.state_data)
+        content = render_panel_text_compact(self.state_data, self.spawn_index)
 
         for key, cid in PANEL_CHANNELS.items():
             channel = await self._get_text_channel(cid)
@@ -547,8 +855,10 @@ class BossBot(commands.Bot):
                 continue
 
             try:
-                msg = await channel.fetch_message(msg_id)  # type: ignore[attr-defined]
-                await msg.edit(content=content, view=self.panel_view)
+                with span("panel.fetch"):
+                    msg = await channel.fetch_message(msg_id)  # type: ignore[attr-defined]
+                with span("panel.edit"):
+                    await msg.edit(content=content, view=self.panel_view)
             except Exception:
                 pm_ids[key] = None
                 save_state(self.state_data)
@@ -558,22 +868,28 @@ class BossBot(commands.Bot):
                     pass
 
     async def reschedule_boss(self, boss_name: str):
-        t = self.alarm_tasks.get(boss_name)
-        if t and not t.done():
-            t.cancel()
-
-        ns = self.state_data["bosses"][boss_name].get("next_spawn")
-        if not isinstance(ns, int) or ns <= 0:
-            self.alarm_tasks.pop(boss_name, None)
-            return
+        with span("reschedule_boss"):
+            t = self.alarm_tasks.get(boss_name)
+            if t and not t.done():
+                t.cancel()
+
+            ns = self.state_data["bosses"][boss_name].get("next_spawn")
+            self.spawn_index.update(boss_name, ns)
+            if not isinstance(ns, int) or ns <= 0:
+                self.alarm_tasks.pop(boss_name, None)
+                return
 
-        self.alarm_tasks[boss_name] = asyncio.create_task(self._alarm_task(boss_name, ns))
+            self.alarm_tasks[boss_name] = asyncio.create_task(self._alarm_task(boss_name, ns))
 
     async def _auto_mark_unhandled(self, boss_name: str, target_ts: int, msg: discord.Message):
         await asyncio.sleep(AUTO_UNHANDLED_SEC)
 
         state = self.state_data
 
+        # 그 사이 보스 목록에서 삭제된 경우
+        if boss_name not in BOSSES:
+            return
+
         # 이미 버튼으로 처리된 경우
         handled_alerts = state.get("handled_alerts", {})
         if handled_alerts.get(str(msg.id)):
@@ -593,6 +909,7 @@ class BossBot(commands.Bot):
         next_spawn = target_ts + interval_sec
         cur["next_spawn"] = next_spawn
         save_state(state)
+        append_history(HISTORY_FILE, boss_name, HIST_AUTO_MISS, None, target_ts)
 
         try:
             mc = int(cur.get("miss_count", 0) or 0)
@@ -626,10 +943,12 @@ class BossBot(commands.Bot):
                 return
 
             if wait1 > 0 and abs(now_ts() - five_before) <= 2:
-                for cid in ALERT_CHANNEL_IDS:
-                    ch = await self._get_text_channel(cid)
-                    if ch:
-                        await ch.send(f"⏰ **{boss_name} 젠 5분전입니다.**\n- 예정: {fmt_kst_only(target_ts)}")
+                with trace("alert.5min", boss=boss_name, target=target_ts):
+                    for cid in ALERT_CHANNEL_IDS:
+                        ch = await self._get_text_channel(cid)
+                        if ch:
+                            with span("alarm.send"):
+                                await ch.send(f"⏰ **{boss_name} 젠 5분전입니다.**\n- 예정: {fmt_kst_only(target_ts)}")
 
             # 2) 정시
             wait2 = target_ts - now_ts()
@@ -638,19 +957,24 @@ class BossBot(commands.Bot):
             else:
                 return
 
+            # 지난 젠은 피드에서 빠지도록
+            self.refresh_feeds()
+
             latest2 = self.state_data["bosses"][boss_name].get("next_spawn")
             if latest2 != target_ts:
                 return
 
-            for cid in ALERT_CHANNEL_IDS:
-                ch = await self._get_text_channel(cid)
-                if ch:
-                    msg = await ch.send(
-                        content=f"🔔 **{boss_name} 젠타임입니다!**",
-                        view=SpawnAlertView(self, boss_name, target_ts),
-                    )  # type: ignore[attr-defined]
+            with trace("alert.spawn", boss=boss_name, target=target_ts):
+                for cid in ALERT_CHANNEL_IDS:
+                    ch = await self._get_text_channel(cid)
+                    if ch:
+                        with span("alarm.send"):
+                            msg = await ch.send(
+                                content=f"🔔 **{boss_name} 젠타임입니다!**",
+                                view=SpawnAlertView(self, boss_name, target_ts),
+                            )  # type: ignore[attr-defined]
 
-                    asyncio.create_task(self._auto_mark_unhandled(boss_name, target_ts, msg))
+                        asyncio.create_task(self._auto_mark_unhandled(boss_name, target_ts, msg))
 
         except asyncio.CancelledError:
             return
@@ -664,8 +988,16 @@ bot = BossBot()
 # -----------------------------
 # Slash Commands
 # -----------------------------
+# 보스명은 고정 선택지 대신 자동완성으로 제공 → 보스 목록이 바뀌어도 명령어 재동기화가 필요 없음
+async def boss_name_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    current = current.strip()
+    return [app_commands.Choice(name=n, value=n) for n in BOSSES.keys() if current in n][:25]
+
+
 @bot.tree.command(name="설정", description="보스의 컷 시간을 입력하면 다음 젠을 자동 계산해 등록합니다.")
-@app_commands.describe(보스="베지/멘지/부활/각성/악계/인과율", 시간="컷시간: HH:MM 또는 YYYY-MM-DD HH:MM (초는 :SS)")
+@app_commands.describe(보스="보스명", 시간="컷시간: HH:MM / HHMM / 21시30분 / 10분전 / MM-DD HH:MM / YYYY-MM-DD HH:MM")
+@app_commands.autocomplete(보스=boss_name_autocomplete)
+@traced("cmd.설정")
 async def set_boss_time(interaction: discord.Interaction, 보스: str, 시간: str):
     if interaction.channel_id not in ALLOWED_CHANNEL_IDS:
         await interaction.response.send_message("이 명령어는 지정 채널에서만 사용해주세요.", ephemeral=True)
@@ -675,15 +1007,18 @@ async def set_boss_time(interaction: discord.Interaction, 보스: str, 시간: s
     if 보스 not in BOSSES:
         await interaction.response.send_message(f"보스명이 올바르지 않습니다. 사용 가능: {', '.join(BOSSES.keys())}", ephemeral=True)
         return
+    trace_note(boss=보스)
 
     cut_ts = parse_cut_time_to_ts(시간)
     if cut_ts is None:
-        await interaction.response.send_message("시간 형식이 올바르지 않습니다. 예: 21:30 / 2026-01-20 09:10", ephemeral=True)
+        await interaction.response.send_message("시간 형식이 올바르지 않습니다. 예: 21:30 / 2130 / 21시30분 / 10분전 / 2026-01-20 09:10", ephemeral=True)
         return
 
     interval_sec = BOSSES[보스] * 3600
     next_ts = cut_ts + interval_sec
 
+    action, due_ts = classify_set(cut_ts, bot.state_data["bosses"][보스].get("next_spawn"))
+    append_history(HISTORY_FILE, 보스, action, cut_ts, due_ts, interaction.user.id)
     bot.state_data["bosses"][보스]["last_cut"] = cut_ts
     bot.state_data["bosses"][보스]["next_spawn"] = next_ts
     bot.state_data["bosses"][보스]["miss_count"] = 0
@@ -698,29 +1033,83 @@ async def set_boss_time(interaction: discord.Interaction, 보스: str, 시간: s
     )
 
 
-@bot.tree.command(name="보탐", description="전체 보스의 다음 젠 시간을 보여줍니다.")
-async def show_next(interaction: discord.Interaction):
+@bot.tree.command(name="보탐", description="보스의 다음 젠 시간을 보여줍니다.")
+@app_commands.describe(
+    개수="가까운 젠 N개만 보기",
+    시간="앞으로 N시간 안의 젠만 보기",
+    정렬="시간순(기본) 또는 등록순 (개수/시간 없이 쓰면 미등록 포함 전체)",
+)
+@app_commands.choices(정렬=[
+    app_commands.Choice(name="시간순", value="time"),
+    app_commands.Choice(name="등록순", value="catalog"),
+])
+@traced("cmd.보탐")
+async def show_next(
+    interaction: discord.Interaction,
+    개수: Optional[app_commands.Range[int, 1, 100]] = None,
+    시간: Optional[app_commands.Range[int, 1, 720]] = None,
+    정렬: Optional[app_commands.Choice[str]] = None,
+):
     if interaction.channel_id not in ALLOWED_CHANNEL_IDS:
         await interaction.response.send_message("이 명령어는 지정 채널에서만 사용해주세요.", ephemeral=True)
         return
 
-    lines = ["**목록**"]
-    for name, hours in BOSSES.items():
-        b = bot.state_data["bosses"][name]
-        ns = b.get("next_spawn")
-        mc = int(b.get("miss_count", 0) or 0)
-
-        if isinstance(ns, int) and ns > 0:
-            tail = f" | 미입력 {mc}회" if mc > 0 else ""
-            lines.append(f"- {name} ({hours}h): {fmt_kst_rel(ns)}{tail}")
-        else:
-            lines.append(f"- {name} ({hours}h): 미등록")
+    state = bot.state_data
+
+    by_catalog = 정렬 is not None and 정렬.value == "catalog"
+
+    if 개수 is None and 시간 is None:
+        lines = ["**목록**"] + render_spawn_lines(state, None if by_catalog else bot.spawn_index)
+    else:
+        # 개수/시간 은 지금 이후의 젠만 고르고, 젠이 지났는데 처리 안 된 보스는 따로 보여줌
+        now = now_ts()
+        until = now + 시간 * 3600 if 시간 is not None else None
+        picked = [name for _, name in bot.spawn_index.upcoming(now, limit=개수, until=until)]
+        overdue = [name for _, name in bot.spawn_index.overdue(now)]
+        if by_catalog:
+            order = {name: i for i, name in enumerate(BOSSES.keys())}
+            picked.sort(key=order.__getitem__)
+            overdue.sort(key=order.__getitem__)
+
+        title = []
+        if 시간 is not None:
+            title.append(f"{시간}시간 이내")
+        if 개수 is not None:
+            title.append(f"가까운 {개수}개")
+        lines = [f"**목록 ({', '.join(title)})**"]
+        lines.extend(render_boss_line(name, state["bosses"][name]) for name in picked)
+        if not picked:
+            lines.append("- 해당하는 젠 없음")
+
+        if overdue:
+            lines.append("")
+            lines.append("**젠 지남 (컷/멍 미처리)**")
+            lines.extend(render_boss_line(name, state["bosses"][name]) for name in overdue)
 
     await interaction.response.send_message("\n".join(lines), ephemeral=False)
 
 
+@bot.tree.command(name="통계", description="최근 기간의 보스별 컷 지연/멍 비율과 멤버별 참여 횟수를 보여줍니다.")
+@app_commands.describe(일수="집계 기간(일), 기본 30일")
+@traced("cmd.통계")
+async def show_stats(interaction: discord.Interaction, 일수: app_commands.Range[int, 1, 3650] = 30):
+    if interaction.channel_id not in ALLOWED_CHANNEL_IDS:
+        await interaction.response.send_message("이 명령어는 지정 채널에서만 사용해주세요.", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=False)
+
+    stats = await asyncio.to_thread(compute_history_stats, HISTORY_FILE, now_ts() - 일수 * 86400, list(BOSSES))
+    await interaction.followup.send(
+        render_history_stats(stats, 일수),
+        allowed_mentions=discord.AllowedMentions.none(),
+    )
+
+
 @bot.tree.command(name="초기화", description="보스의 다음 젠 시간을 미등록 상태로 초기화합니다.")
-@app_commands.describe(보스="베지/멘지/부활/각성/악계/인과율")
+@app_commands.describe(보스="보스명")
+@app_commands.autocomplete(보스=boss_name_autocomplete)
+@traced("cmd.초기화")
 async def reset_boss(interaction: discord.Interaction, 보스: str):
     if interaction.channel_id not in ALLOWED_CHANNEL_IDS:
         await interaction.response.send_message("이 명령어는 지정 채널에서만 사용해주세요.", ephemeral=True)
@@ -730,6 +1119,7 @@ async def reset_boss(interaction: discord.Interaction, 보스: str):
     if 보스 not in BOSSES:
         await interaction.response.send_message(f"보스명이 올바르지 않습니다. 사용 가능: {', '.join(BOSSES.keys())}", ephemeral=True)
         return
+    trace_note(boss=보스)
 
     bot.state_data["bosses"][보스]["next_spawn"] = None
     bot.state_data["bosses"][보스]["last_cut"] = None
@@ -740,12 +1130,14 @@ async def reset_boss(interaction: discord.Interaction, 보스: str):
     if t and not t.done():
         t.cancel()
     bot.alarm_tasks.pop(보스, None)
+    bot.spawn_index.discard(보스)
 
     await bot.update_panel_message()
     await interaction.response.send_message(f"🧹 **{보스} 초기화 완료**\n- 다음 젠: 미등록", ephemeral=False)
 
 
 @bot.tree.command(name="초기화전체", description="전체 보스를 미등록 상태로 초기화합니다.")
+@traced("cmd.초기화전체")
 async def reset_all(interaction: discord.Interaction):
     if interaction.channel_id not in ALLOWED_CHANNEL_IDS:
         await interaction.response.send_message("이 명령어는 지정 채널에서만 사용해주세요.", ephemeral=True)
@@ -760,13 +1152,40 @@ async def reset_all(interaction: discord.Interaction):
         if t and not t.done():
             t.cancel()
         bot.alarm_tasks.pop(boss, None)
+        bot.spawn_index.discard(boss)
 
     save_state(bot.state_data)
     await bot.update_panel_message()
     await interaction.response.send_message("🧹 **전체 보스 초기화 완료**\n- 다음 젠: 모두 미등록", ephemeral=False)
 
 
+@bot.tree.command(name="트레이스", description="최근 처리 시간 기록(트레이스)을 파일로 받습니다.")
+@traced("cmd.트레이스")
+async def dump_traces(interaction: discord.Interaction):
+    if interaction.channel_id not in ALLOWED_CHANNEL_IDS:
+        await interaction.response.send_message("이 명령어는 지정 채널에서만 사용해주세요.", ephemeral=True)
+        return
+
+    if not TRACE_ENABLED:
+        await interaction.response.send_message("트레이싱이 꺼져 있습니다. (TRACE_ENABLED=1 로 실행)", ephemeral=True)
+        return
+
+    records = list(RECENT_TRACES)
+    if not records:
+        await interaction.response.send_message("기록된 트레이스가 없습니다.", ephemeral=True)
+        return
+
+    body = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+    slowest = max(records, key=lambda r: r["ms"])
+    await interaction.response.send_message(
+        f"최근 트레이스 {len(records)}건 (가장 느린 처리: {slowest['name']} {slowest['ms']:.0f}ms, 기준 {TRACE_SLOW_MS:.0f}ms)",
+        file=discord.File(io.BytesIO(body), filename="traces.jsonl"),
+        ephemeral=True,
+    )
+
+
 @bot.tree.command(name="사용법", description="보스 알람 봇 사용법을 안내합니다.")
+@traced("cmd.사용법")
 async def help_usage(interaction: discord.Interaction):
     if interaction.channel_id not in ALLOWED_CHANNEL_IDS:
         await interaction.response.send_message("이 명령어는 지정 채널에서만 사용해주세요.", ephemeral=True)
@@ -781,7 +1200,10 @@ async def help_usage(interaction: discord.Interaction):
         "- `/설정 보스명 시간` : 컷시간 입력 → 다음 젠 자동 계산\n"
         "  - 예) `/설정 베지 21:30`\n"
         "  - 예) `/설정 베지 2026-01-20 09:10`\n"
-        "- `/보탐` : 전체 보스 다음 젠 목록 출력(미입력 횟수 포함)\n"
+        "  - 예) `/설정 베지 2130`, `/설정 베지 21시30분`, `/설정 베지 10분전`\n"
+        "- `/보탐` : 전체 보스 다음 젠 목록 출력(시간순, 미입력 횟수 포함)\n"
+        "  - `/보탐 개수:3` 가까운 3개 / `/보탐 시간:2` 2시간 이내 / `/보탐 정렬:등록순`\n"
+        "- `/통계 [일수]` : 보스별 컷 지연/멍 비율, 멤버별 참여 횟수\n"
         "- `/초기화 보스명` : 해당 보스 미등록으로 초기화\n"
         "- `/초기화전체` : 전체 보스 미등록으로 초기화\n\n"
         "3) **알림**\n"
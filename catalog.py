@@ -0,0 +1,94 @@
+"""
+보스 목록(보스명 -> 리젠 시간(h)) 파일 읽기와 변경 비교.
+"""
+import json
+import os
+from typing import Any, Dict, List, NamedTuple, Optional
+
+PANEL_ACTIONS = ("컷", "멍")
+
+# 디스코드 버튼 제한
+BUTTON_LABEL_MAX = 80
+CUSTOM_ID_MAX = 100
+
+
+def button_label(boss_name: str, action: str) -> str:
+    return f"{boss_name} {action}"
+
+
+def button_custom_id(boss_name: str, action: str) -> str:
+    return f"boss:{boss_name}:{action}"
+
+
+def read_boss_catalog(path: str) -> Optional[Dict[str, int]]:
+    """보스 목록 파일을 읽습니다. 파일이 없거나 형식이 잘못되면 None."""
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"[CATALOG_ERROR] {path} read failed: {e}")
+        return None
+
+    if not isinstance(data, dict) or not data:
+        print(f"[CATALOG_ERROR] {path}: 보스명 -> 리젠 시간(h) 형식의 객체여야 합니다.")
+        return None
+
+    out: Dict[str, int] = {}
+    for name, hours in data.items():
+        name = str(name).strip()
+        if not name:
+            print(f"[CATALOG_ERROR] {path}: 빈 보스명이 있습니다.")
+            return None
+        # 버튼 라벨/custom_id 가 디스코드 제한을 넘으면 패널 수정 자체가 실패하므로 미리 거름
+        if any(
+            len(button_label(name, a)) > BUTTON_LABEL_MAX or len(button_custom_id(name, a)) > CUSTOM_ID_MAX
+            for a in PANEL_ACTIONS
+        ):
+            print(f"[CATALOG_ERROR] {path}: 보스명이 너무 깁니다: '{name}'")
+            return None
+        if isinstance(hours, bool) or not isinstance(hours, int) or hours <= 0:
+            print(f"[CATALOG_ERROR] {path}: '{name}' 의 리젠 시간이 올바르지 않습니다: {hours!r}")
+            return None
+        if name in out:
+            print(f"[CATALOG_ERROR] {path}: 보스명이 중복됩니다: '{name}'")
+            return None
+        out[name] = hours
+    return out
+
+
+class CatalogChange(NamedTuple):
+    added: List[str]
+    removed: List[str]
+    changed: List[str]
+    # 리젠 시간 변경으로 다음 젠을 다시 계산할 보스 -> 새 next_spawn
+    next_spawns: Dict[str, int]
+
+
+def plan_catalog_change(
+    old: Dict[str, int],
+    new: Dict[str, int],
+    bosses_state: Dict[str, Dict[str, Any]],
+) -> Optional[CatalogChange]:
+    """
+    현재 목록(old)과 새 목록(new)을 비교합니다. 바뀐 것이 없으면(순서 포함) None.
+    리젠 시간이 바뀐 보스는 다음 젠이 컷 기준(last_cut + 기존 리젠)일 때만 새 리젠 시간으로
+    다시 계산하고, 멍으로 연장된 경우는 다음 주기부터 적용되도록 그대로 둡니다.
+    """
+    added = [n for n in new if n not in old]
+    removed = [n for n in old if n not in new]
+    changed = [n for n in new if n in old and new[n] != old[n]]
+
+    if not (added or removed or changed) and list(new) == list(old):
+        return None
+
+    next_spawns: Dict[str, int] = {}
+    for name in changed:
+        cur = bosses_state.get(name, {})
+        lc = cur.get("last_cut")
+        if isinstance(lc, int) and cur.get("next_spawn") == lc + old[name] * 3600:
+            next_spawns[name] = lc + new[name] * 3600
+
+    return CatalogChange(added, removed, changed, next_spawns)
@@ -0,0 +1,197 @@
+"""
+HTTP 헬스체크 + 젠 타임라인 피드(JSON / iCalendar).
+"""
+import datetime
+import gzip
+import hashlib
+import json
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytz
+
+from history import boss_key
+from spawnindex import SpawnIndex
+
+KST = pytz.timezone("Asia/Seoul")
+
+# 경로 -> {"etag", "body", "gzip", "content_type"}
+# 상태가 바뀔 때 봇 쪽에서 통째로 다시 만들어 교체하므로 요청 처리 시 계산이 없습니다.
+FEEDS: Dict[str, Dict[str, Any]] = {}
+
+
+def _ics_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _fmt_ics_kst(ts: int) -> str:
+    return datetime.datetime.fromtimestamp(ts, KST).strftime("%Y%m%dT%H%M%S")
+
+
+def select_feed_spawns(index: SpawnIndex, now: int) -> List[Tuple[int, str]]:
+    """피드에 넣을 젠: 아직 오지 않은 것만 (지난 젠/자동 멍 대기 중인 젠은 제외)."""
+    return index.upcoming(now + 1)
+
+
+def build_feed_bodies(
+    state: Dict[str, Any],
+    spawns: List[Tuple[int, str]],
+    intervals: Dict[str, int],
+    stamp: int,
+) -> Dict[str, Tuple[str, bytes]]:
+    """시간순 (next_spawn, 보스명) 목록으로 JSON / iCalendar 본문을 만듭니다."""
+    items = []
+    for ns, name in spawns:
+        b = state["bosses"][name]
+        items.append({
+            "boss": name,
+            "interval_hours": intervals[name],
+            "next_spawn": ns,
+            "next_spawn_kst": datetime.datetime.fromtimestamp(ns, KST).isoformat(),
+            "miss_count": int(b.get("miss_count", 0) or 0),
+        })
+    body_json = json.dumps(
+        {"timezone": "Asia/Seoul", "updated_at": stamp, "spawns": items},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//boss-alarm-bot//spawn timeline//KO",
+        "CALSCALE:GREGORIAN",
+        "X-WR-CALNAME:보스 젠",
+        "X-WR-TIMEZONE:Asia/Seoul",
+        "BEGIN:VTIMEZONE",
+        "TZID:Asia/Seoul",
+        "BEGIN:STANDARD",
+        "DTSTART:19700101T000000",
+        "TZOFFSETFROM:+0900",
+        "TZOFFSETTO:+0900",
+        "TZNAME:KST",
+        "END:STANDARD",
+        "END:VTIMEZONE",
+    ]
+    dtstamp = datetime.datetime.fromtimestamp(stamp, datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    for it in items:
+        name = it["boss"]
+        summary = _ics_escape(f"{name} 젠")
+        desc = _ics_escape(f"리젠 {it['interval_hours']}시간 | 미입력 {it['miss_count']}회")
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:boss-{boss_key(name):08x}@boss-alarm-bot",
+            f"DTSTAMP:{dtstamp}",
+            f"DTSTART;TZID=Asia/Seoul:{_fmt_ics_kst(it['next_spawn'])}",
+            f"SUMMARY:{summary}",
+            f"DESCRIPTION:{desc}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    body_ics = ("\r\n".join(lines) + "\r\n").encode("utf-8")
+
+    return {
+        "/spawns.json": ("application/json; charset=utf-8", body_json),
+        "/spawns.ics": ("text/calendar; charset=utf-8", body_ics),
+    }
+
+
+def publish_feeds(bodies: Dict[str, Tuple[str, bytes]]) -> None:
+    for path, (content_type, body) in bodies.items():
+        FEEDS[path] = {
+            "etag": hashlib.sha1(body).hexdigest()[:16],
+            "body": body,
+            "gzip": gzip.compress(body, mtime=0),
+            "content_type": content_type,
+        }
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Accept-Encoding 에서 gzip 의 q 값이 0 보다 큰지(명시 없으면 * 기준) 판단합니다."""
+    gzip_q: Optional[float] = None
+    star_q: Optional[float] = None
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            k, _, v = param.strip().partition("=")
+            if k.strip().lower() == "q":
+                try:
+                    q = float(v)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            gzip_q = q
+        elif coding == "*":
+            star_q = q
+
+    if gzip_q is not None:
+        return gzip_q > 0
+    return star_q is not None and star_q > 0
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 가 현재 본문을 가리키는지(W/ 접두사, gzip 변형 -gz 접미사 무시)."""
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        if tag.endswith("-gz"):
+            tag = tag[:-3]
+        if tag and tag == etag:
+            return True
+    return False
+
+
+def feed_response(feed: Dict[str, Any], accept_encoding: str, if_none_match: str) -> Tuple[int, List[Tuple[str, str]], bytes]:
+    """캐시된 피드 하나에 대한 (상태 코드, 헤더, 본문)."""
+    use_gzip = accepts_gzip(accept_encoding)
+    etag = f'"{feed["etag"]}-gz"' if use_gzip else f'"{feed["etag"]}"'
+    headers = [("ETag", etag), ("Cache-Control", "no-cache"), ("Vary", "Accept-Encoding")]
+
+    if _etag_matches(if_none_match, feed["etag"]):
+        return 304, headers, b""
+
+    body = feed["gzip"] if use_gzip else feed["body"]
+    headers += [("Content-type", feed["content_type"]), ("Content-Length", str(len(body)))]
+    if use_gzip:
+        headers.append(("Content-Encoding", "gzip"))
+    return 200, headers, body
+
+
+class SimpleHandler(BaseHTTPRequestHandler):
+    def _serve(self, with_body: bool):
+        feed = FEEDS.get(self.path.split("?", 1)[0])
+        if feed is None:
+            self.send_response(200)
+            self.send_header("Content-type", "text/plain")
+            self.end_headers()
+            if with_body:
+                self.wfile.write(b"OK")
+            return
+
+        status, headers, body = feed_response(
+            feed,
+            self.headers.get("Accept-Encoding", ""),
+            self.headers.get("If-None-Match", ""),
+        )
+        self.send_response(status)
+        for k, v in headers:
+            self.send_header(k, v)
+        self.end_headers()
+        if with_body and body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._serve(with_body=True)
+
+    def do_HEAD(self):
+        self._serve(with_body=False)
+
+    def log_message(self, format, *args):
+        # 피드 폴링 요청마다 stderr 로 찍히지 않도록
+        pass
@@ -0,0 +1,214 @@
+"""
+컷/멍 기록 (append-only, 고정폭 int64 6열).
+
+한 행 = (at, cut_ts, due_ts, user_id, boss_key, action), 모두 little-endian int64.
+- at: 기록 시각(항상 증가 → 기간 조회 시 bisect)
+- cut_ts: 컷 시각(멍/자동멍이면 0)
+- due_ts: 처리 직전의 예정 젠 시각(미등록이면 0)
+- boss_key: 보스명 crc32 (보스 목록이 바뀌어도 기록이 유지됨)
+numpy 에서는 np.memmap(path, dtype="<i8").reshape(-1, 6) 로 그대로 읽힙니다.
+"""
+import bisect
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections import Counter, defaultdict
+from itertools import compress, repeat
+from operator import and_, floordiv, sub
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # requirements 에 포함. 없으면 표준 라이브러리 경로로 대체
+    np = None
+
+HISTORY_COLS = 6
+HISTORY_ROW = struct.Struct("<" + "q" * HISTORY_COLS)
+
+# 한 번에 집계하는 행 수. 메모리 사용량은 이 크기에 비례하고 전체 행 수와는 무관합니다.
+HISTORY_CHUNK_ROWS = 1 << 16
+
+# numpy 가 없을 때 한 번에 집계하는 최대 행 수(약 0.5초). 넘으면 최근 행만 집계합니다.
+HISTORY_MAX_SCAN_ROWS = 1_000_000
+
+HIST_CUT = 0
+HIST_MISS = 1
+HIST_AUTO_MISS = 2
+HIST_SET = 3
+HIST_SET_FIX = 4  # 이미 기록된 컷을 /설정 으로 정정 (컷/지연 집계에서 제외)
+
+
+def classify_set(cut_ts: int, prev_next_spawn: Optional[int]) -> Tuple[int, Optional[int]]:
+    """
+    /설정 기록의 (action, due_ts).
+    다음 젠이 이미 입력한 컷 시각 이후로 잡혀 있으면 컷 버튼 등으로 먼저 기록된 컷을
+    고치는 경우이므로, 컷 횟수가 두 번 세어지거나 지연이 한 주기만큼 음수로 잡히지 않게
+    HIST_SET_FIX 로 남기고 예정 시각은 비웁니다.
+    """
+    if isinstance(prev_next_spawn, int) and prev_next_spawn > cut_ts:
+        return HIST_SET_FIX, None
+    return HIST_SET, prev_next_spawn
+
+
+def boss_key(name: str) -> int:
+    return zlib.crc32(name.encode("utf-8"))
+
+
+def append_history(path: str, boss_name: str, action: int, cut_ts: Optional[int], due_ts: Optional[int], user_id: int = 0) -> None:
+    row = HISTORY_ROW.pack(
+        int(time.time()),
+        cut_ts if isinstance(cut_ts, int) else 0,
+        due_ts if isinstance(due_ts, int) else 0,
+        user_id,
+        boss_key(boss_name),
+        action,
+    )
+    try:
+        with open(path, "ab") as f:
+            # 비정상 종료로 쓰다 만 행이 있으면 잘라내서 행 정렬을 유지
+            pos = f.tell()
+            if pos % HISTORY_ROW.size:
+                f.truncate(pos - pos % HISTORY_ROW.size)
+            f.write(row)
+    except Exception as e:
+        print(f"[HISTORY_ERROR] {boss_name} append failed: {e}")
+
+
+def _hist_stats(hist: Dict[int, int]) -> Dict[str, int]:
+    """분 단위 지연 히스토그램 -> 분포 요약(초)."""
+    items = sorted(hist.items())
+    n = sum(c for _, c in items)
+
+    def quantile(rank: int) -> int:
+        acc = 0
+        for minute, c in items:
+            acc += c
+            if acc > rank:
+                return minute * 60
+        return items[-1][0] * 60
+
+    return {
+        "median": quantile(n // 2),
+        "p10": quantile(n // 10),
+        "p90": quantile(min(n - 1, n * 9 // 10)),
+        "mean": sum(m * c for m, c in items) * 60 // n,
+    }
+
+
+def _aggregate_stdlib(path: str, nbytes: int, since_ts: int, max_rows: int) -> Tuple[int, bool, Counter, Counter, Counter]:
+    """
+    표준 라이브러리 경로: mmap 을 HISTORY_CHUNK_ROWS 행씩 열(strided memoryview)로 잘라
+    Counter/zip/map 등 C 레벨 반복으로 집계합니다. 메모리는 청크 크기만큼만 사용합니다.
+    """
+    counts: Counter = Counter()
+    members: Counter = Counter()
+    delays: Counter = Counter()
+    C = HISTORY_COLS
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), nbytes, access=mmap.ACCESS_READ) as mm:
+        # 모든 view 를 with 로 해제해야 mmap 을 닫을 수 있음(남아 있으면 BufferError)
+        with memoryview(mm) as raw, raw.cast("q") as flat:
+            total = len(flat) // C
+            with flat[0::C] as at:
+                start = bisect.bisect_left(at, since_ts)
+
+            truncated = total - start > max_rows
+            if truncated:
+                start = total - max_rows
+
+            for lo in range(start, total, HISTORY_CHUNK_ROWS):
+                hi = min(total, lo + HISTORY_CHUNK_ROWS)
+                with flat[lo * C:hi * C] as chunk, \
+                        chunk[1::C] as cut, chunk[2::C] as due, chunk[3::C] as user, \
+                        chunk[4::C] as boss, chunk[5::C] as act:
+                    counts.update(zip(boss, act))
+                    members.update(user)
+                    minutes = map(floordiv, map(sub, cut, due), repeat(60))
+                    delays.update(compress(zip(boss, minutes), map(and_, map(bool, cut), map(bool, due))))
+
+    return total - start, truncated, counts, members, delays
+
+
+def _aggregate_numpy(path: str, nrows: int, since_ts: int) -> Tuple[int, bool, Counter, Counter, Counter]:
+    """numpy 경로: 같은 집계를 np.memmap 위에서 청크 단위 벡터 연산으로 수행합니다."""
+    counts: Counter = Counter()
+    members: Counter = Counter()
+    delays: Counter = Counter()
+
+    table = np.memmap(path, dtype="<i8", mode="r", shape=(nrows, HISTORY_COLS))
+    start = int(np.searchsorted(table[:, 0], since_ts, side="left"))
+
+    step = HISTORY_CHUNK_ROWS * 4
+    for lo in range(start, nrows, step):
+        w = table[lo:lo + step]
+        cut, due, user, boss, act = w[:, 1], w[:, 2], w[:, 3], w[:, 4], w[:, 5]
+
+        keys, n = np.unique(boss * 8 + act, return_counts=True)
+        counts.update({(int(k) >> 3, int(k) & 7): int(c) for k, c in zip(keys, n)})
+
+        ids, n = np.unique(user, return_counts=True)
+        members.update({int(k): int(c) for k, c in zip(ids, n)})
+
+        # (보스, 지연 분) 을 uint64 하나로 묶어서 unique
+        m = (cut > 0) & (due > 0)
+        minutes = np.clip((cut[m] - due[m]) // 60, -(1 << 31), (1 << 31) - 1)
+        packed = (boss[m].astype(np.uint64) << np.uint64(32)) | (minutes + (1 << 31)).astype(np.uint64)
+        keys, n = np.unique(packed, return_counts=True)
+        delays.update({(int(k) >> 32, (int(k) & 0xFFFFFFFF) - (1 << 31)): int(c) for k, c in zip(keys, n)})
+
+    del table
+    return nrows - start, False, counts, members, delays
+
+
+def compute_history_stats(path: str, since_ts: int, boss_names: Iterable[str]) -> Dict[str, Any]:
+    """
+    since_ts 이후 기록으로 보스별 컷 지연(컷 - 예정) 분포, 멍 비율, 멤버별 참여 횟수를 계산합니다.
+
+    numpy 가 있으면 np.memmap 으로 벡터 집계하고, 없으면 표준 라이브러리로 청크 단위 집계합니다.
+    표준 라이브러리 경로는 응답 시간을 지키기 위해 최근 HISTORY_MAX_SCAN_ROWS 행까지만 봅니다
+    (이 경우 결과의 truncated 가 True). 컷 지연 분포는 분 단위 히스토그램으로 계산합니다.
+    """
+    out: Dict[str, Any] = {"rows": 0, "truncated": False, "bosses": {}, "members": {}}
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return out
+
+    nbytes = size - size % HISTORY_ROW.size  # 쓰다 만 마지막 행은 무시
+    if nbytes <= 0:
+        return out
+
+    if np is not None:
+        rows, truncated, counts, members, delays = _aggregate_numpy(path, nbytes // HISTORY_ROW.size, since_ts)
+    else:
+        rows, truncated, counts, members, delays = _aggregate_stdlib(path, nbytes, since_ts, HISTORY_MAX_SCAN_ROWS)
+    out["rows"] = rows
+    out["truncated"] = truncated
+
+    per_boss_delay: Dict[int, Dict[int, int]] = defaultdict(dict)
+    for (bk, minute), c in delays.items():
+        per_boss_delay[bk][minute] = c
+
+    for name in boss_names:
+        bk = boss_key(name)
+        n_cut = counts[(bk, HIST_CUT)] + counts[(bk, HIST_SET)]
+        n_miss = counts[(bk, HIST_MISS)]
+        n_auto = counts[(bk, HIST_AUTO_MISS)]
+        total_actions = n_cut + n_miss + n_auto
+        if total_actions == 0:
+            continue
+
+        hist = per_boss_delay.get(bk)
+        out["bosses"][name] = {
+            "cut": n_cut,
+            "miss": n_miss,
+            "auto_miss": n_auto,
+            "miss_rate": (n_miss + n_auto) / total_actions,
+            "delay": _hist_stats(hist) if hist else None,
+        }
+
+    members.pop(0, None)  # 자동 처리
+    out["members"] = dict(members.most_common())
+    return out
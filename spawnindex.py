@@ -0,0 +1,63 @@
+"""
+보스 다음 젠 시간 정렬 인덱스.
+"""
+import bisect
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class SpawnIndex:
+    """
+    (next_spawn, 보스명) 을 시간순으로 유지하는 인덱스.
+    상태 변경 시 update/discard 로 해당 보스만 bisect 로 갱신합니다(전체 재정렬 없음).
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[int, str]] = []
+        self._ns: Dict[str, int] = {}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "SpawnIndex":
+        idx = cls()
+        for name, b in state["bosses"].items():
+            idx.update(name, b.get("next_spawn"))
+        return idx
+
+    def update(self, name: str, ns: Optional[int]) -> None:
+        if self._ns.get(name) == ns:
+            return
+        self.discard(name)
+        if isinstance(ns, int) and ns > 0:
+            bisect.insort(self._keys, (ns, name))
+            self._ns[name] = ns
+
+    def discard(self, name: str) -> None:
+        old = self._ns.pop(name, None)
+        if old is None:
+            return
+        i = bisect.bisect_left(self._keys, (old, name))
+        if i < len(self._keys) and self._keys[i] == (old, name):
+            del self._keys[i]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ns
+
+    def ordered(self) -> List[Tuple[int, str]]:
+        """등록된 전체 (next_spawn, 보스명), 시간순(지난 젠 포함)."""
+        return list(self._keys)
+
+    def overdue(self, now: int) -> List[Tuple[int, str]]:
+        """젠 시간이 지났지만 아직 컷/멍 처리되지 않은 항목(자동 멍 대기 중)."""
+        return self._keys[:bisect.bisect_left(self._keys, (now, ""))]
+
+    def upcoming(self, now: int, limit: Optional[int] = None, until: Optional[int] = None) -> List[Tuple[int, str]]:
+        """now 이후의 (next_spawn, 보스명), 시간순. until(포함)까지, 최대 limit 개."""
+        start = bisect.bisect_left(self._keys, (now, ""))
+        end = len(self._keys)
+        if until is not None:
+            end = bisect.bisect_right(self._keys, (until, "\U0010ffff"), lo=start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return self._keys[start:end]
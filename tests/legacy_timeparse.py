@@ -0,0 +1,56 @@
+"""
+원래 bot.py 에 있던 split 기반 컷 시간 파서(비교 기준용).
+'지금' 을 주입할 수 있게 now 인자만 추가했고 나머지는 원본 그대로입니다.
+"""
+import datetime
+from typing import Optional
+
+import pytz
+
+KST = pytz.timezone("Asia/Seoul")
+
+
+def legacy_parse_cut_time_to_ts(text: str, now: Optional[datetime.datetime] = None) -> Optional[int]:
+    text = text.strip()
+
+    # YYYY-MM-DD HH:MM(:SS)
+    try:
+        if " " in text and "-" in text:
+            date_part, time_part = text.split(" ", 1)
+            y, m, d = map(int, date_part.split("-"))
+            tparts = list(map(int, time_part.split(":")))
+            if len(tparts) == 2:
+                hh, mm = tparts
+                ss = 0
+            elif len(tparts) == 3:
+                hh, mm, ss = tparts
+            else:
+                return None
+            dt = KST.localize(datetime.datetime(y, m, d, hh, mm, ss))
+            return int(dt.timestamp())
+    except Exception:
+        pass
+
+    # HH:MM(:SS) -> 가장 최근 발생한 시각
+    try:
+        if ":" in text and "-" not in text:
+            tparts = list(map(int, text.split(":")))
+            if len(tparts) == 2:
+                hh, mm = tparts
+                ss = 0
+            elif len(tparts) == 3:
+                hh, mm, ss = tparts
+            else:
+                return None
+
+            now = now if now is not None else datetime.datetime.now(KST)
+            dt = KST.localize(datetime.datetime(now.year, now.month, now.day, hh, mm, ss))
+
+            if dt > now:
+                dt = dt - datetime.timedelta(days=1)
+
+            return int(dt.timestamp())
+    except Exception:
+        pass
+
+    return None
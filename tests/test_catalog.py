@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from catalog import (
+    BUTTON_LABEL_MAX,
+    CUSTOM_ID_MAX,
+    PANEL_ACTIONS,
+    button_custom_id,
+    button_label,
+    plan_catalog_change,
+    read_boss_catalog,
+)
+
+H = 3600
+
+
+def write(tmp_path, data):
+    path = tmp_path / "bosses.json"
+    path.write_text(json.dumps(data, ensure_ascii=False) if not isinstance(data, str) else data, encoding="utf-8")
+    return str(path)
+
+
+def test_read_valid(tmp_path):
+    assert read_boss_catalog(write(tmp_path, {" 베지 ": 6, "악계": 12})) == {"베지": 6, "악계": 12}
+
+
+def test_read_missing(tmp_path):
+    assert read_boss_catalog(str(tmp_path / "nope.json")) is None
+
+
+@pytest.mark.parametrize("data", [
+    "{not json",
+    [],
+    {},
+    {"": 6},
+    {"베지": 0},
+    {"베지": -1},
+    {"베지": 1.5},
+    {"베지": True},
+    {"베지": "6"},
+    {"베지": 6, " 베지": 6},
+])
+def test_read_rejects_invalid(tmp_path, data):
+    assert read_boss_catalog(write(tmp_path, data)) is None
+
+
+def test_read_rejects_names_over_discord_limits(tmp_path):
+    longest = max(
+        n for n in range(1, 200)
+        if all(len(button_label("가" * n, a)) <= BUTTON_LABEL_MAX and len(button_custom_id("가" * n, a)) <= CUSTOM_ID_MAX
+               for a in PANEL_ACTIONS)
+    )
+    assert read_boss_catalog(write(tmp_path, {"가" * longest: 6})) == {"가" * longest: 6}
+    assert read_boss_catalog(write(tmp_path, {"가" * (longest + 1): 6})) is None
+
+
+def test_plan_noop():
+    old = {"a": 6, "b": 12}
+    assert plan_catalog_change(old, dict(old), {}) is None
+
+
+def test_plan_reorder_only():
+    plan = plan_catalog_change({"a": 6, "b": 12}, {"b": 12, "a": 6}, {})
+    assert plan is not None
+    assert (plan.added, plan.removed, plan.changed, plan.next_spawns) == ([], [], [], {})
+
+
+def test_plan_added_removed_changed():
+    old = {"a": 6, "b": 6, "c": 12}
+    new = {"a": 6, "c": 24, "d": 3}
+    state = {
+        "a": {"next_spawn": 1000 + 6 * H, "last_cut": 1000},
+        "b": {"next_spawn": None, "last_cut": None},
+        "c": {"next_spawn": 5000 + 12 * H, "last_cut": 5000},
+    }
+    plan = plan_catalog_change(old, new, state)
+    assert plan.added == ["d"]
+    assert plan.removed == ["b"]
+    assert plan.changed == ["c"]
+    assert plan.next_spawns == {"c": 5000 + 24 * H}
+
+
+def test_plan_keeps_next_spawn_extended_by_miss():
+    # 멍으로 한 주기 연장된 다음 젠(last_cut + 2 * 기존 리젠)은 그대로
+    state = {"a": {"next_spawn": 1000 + 2 * 6 * H, "last_cut": 1000}}
+    plan = plan_catalog_change({"a": 6}, {"a": 8}, state)
+    assert plan.changed == ["a"]
+    assert plan.next_spawns == {}
+
+
+def test_plan_skips_unregistered_or_set_without_cut():
+    state = {
+        "a": {"next_spawn": None, "last_cut": None},
+        "b": {"next_spawn": 9999, "last_cut": None},
+    }
+    plan = plan_catalog_change({"a": 6, "b": 6}, {"a": 8, "b": 8}, state)
+    assert plan.changed == ["a", "b"]
+    assert plan.next_spawns == {}
@@ -0,0 +1,123 @@
+import gzip
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import feeds
+from feeds import (
+    SimpleHandler,
+    accepts_gzip,
+    build_feed_bodies,
+    feed_response,
+    publish_feeds,
+    select_feed_spawns,
+)
+from spawnindex import SpawnIndex
+
+NOW = 1_800_000_000
+INTERVALS = {"베지": 6, "멘지": 6, "악계": 12}
+STATE = {
+    "bosses": {
+        "베지": {"next_spawn": NOW - 3600, "miss_count": 0},   # 지남(자동 멍 대기)
+        "멘지": {"next_spawn": NOW, "miss_count": 0},          # 지금 → 이미 지난 것으로 봄
+        "악계": {"next_spawn": NOW + 7200, "miss_count": 2},
+    },
+}
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("GZIP", True),
+    ("deflate, gzip;q=0.5", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.0, deflate", False),
+    ("*;q=0, gzip", True),
+    ("gzip;q=0, *", False),
+    ("br, *;q=0.1", True),
+    ("*;q=0", False),
+    ("", False),
+])
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+@pytest.fixture
+def feed():
+    bodies = build_feed_bodies(STATE, select_feed_spawns(SpawnIndex.from_state(STATE), NOW), INTERVALS, NOW)
+    publish_feeds(bodies)
+    return feeds.FEEDS
+
+
+def test_bodies_contain_only_future_spawns(feed):
+    data = json.loads(feed["/spawns.json"]["body"])
+    assert [s["boss"] for s in data["spawns"]] == ["악계"]
+    assert data["spawns"][0]["next_spawn_kst"].endswith("+09:00")
+    assert data["spawns"][0]["interval_hours"] == 12
+
+    ics = feed["/spawns.ics"]["body"].decode("utf-8")
+    assert ics.count("BEGIN:VEVENT") == 1
+    assert "SUMMARY:악계 젠" in ics
+    assert "베지" not in ics and "멘지" not in ics
+    assert all(line.endswith("\r") or line == "" for line in ics.split("\n"))
+
+
+def test_response_identity_and_gzip(feed):
+    f = feed["/spawns.json"]
+    status, headers, body = feed_response(f, "", "")
+    h = dict(headers)
+    assert status == 200 and body == f["body"]
+    assert h["ETag"] == f'"{f["etag"]}"' and "Content-Encoding" not in h
+
+    status, headers, body = feed_response(f, "gzip", "")
+    h = dict(headers)
+    assert status == 200 and gzip.decompress(body) == f["body"]
+    assert h["ETag"] == f'"{f["etag"]}-gz"' and h["Content-Encoding"] == "gzip"
+
+    status, headers, body = feed_response(f, "gzip;q=0", "")
+    assert body == f["body"] and "Content-Encoding" not in dict(headers)
+
+
+@pytest.mark.parametrize("inm", [
+    '"{e}"',
+    '"{e}-gz"',
+    'W/"{e}"',
+    'W/"{e}-gz"',
+    '"other", W/"{e}-gz"',
+    "*",
+])
+def test_if_none_match_returns_304(feed, inm):
+    f = feed["/spawns.ics"]
+    status, _, body = feed_response(f, "gzip", inm.format(e=f["etag"]))
+    assert status == 304 and body == b""
+
+
+def test_stale_etag_returns_200(feed):
+    f = feed["/spawns.ics"]
+    assert feed_response(f, "", '"deadbeef", W/"x-gz"')[0] == 200
+
+
+def test_live_server(feed):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SimpleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(base + "/") as r:
+            assert r.read() == b"OK"
+
+        req = urllib.request.Request(base + "/spawns.json", headers={"Accept-Encoding": "gzip"})
+        with urllib.request.urlopen(req) as r:
+            etag = r.headers["ETag"]
+            assert r.headers["Content-Encoding"] == "gzip"
+            assert json.loads(gzip.decompress(r.read()))["spawns"][0]["boss"] == "악계"
+
+        req = urllib.request.Request(base + "/spawns.json", headers={"If-None-Match": f"W/{etag}"})
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(req)
+        assert e.value.code == 304
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,124 @@
+import pytest
+
+import history
+from history import (
+    HIST_AUTO_MISS,
+    HIST_CUT,
+    HIST_MISS,
+    HIST_SET,
+    HIST_SET_FIX,
+    HISTORY_ROW,
+    append_history,
+    boss_key,
+    classify_set,
+    compute_history_stats,
+)
+
+NAMES = ["베지", "악계"]
+
+
+@pytest.fixture(params=["stdlib", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        if history.np is None:
+            pytest.skip("numpy not installed")
+    else:
+        monkeypatch.setattr(history, "np", None)
+    return request.param
+
+
+def write_rows(path, rows):
+    with open(path, "wb") as f:
+        for at, cut, due, user, boss, action in rows:
+            f.write(HISTORY_ROW.pack(at, cut, due, user, boss_key(boss), action))
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = str(tmp_path / "history.bin")
+    write_rows(path, [
+        (1000, 0, 900, 7, "베지", HIST_MISS),          # 기간 밖
+        (2000, 2060, 2000, 7, "베지", HIST_CUT),       # +1분
+        (2100, 2400, 2100, 8, "베지", HIST_CUT),       # +5분
+        (2200, 2200, 0, 8, "베지", HIST_SET),          # 예정 없음 → 지연 제외
+        (2300, 0, 2300, 0, "베지", HIST_AUTO_MISS),
+        (2400, 0, 2400, 8, "악계", HIST_MISS),
+        (2500, 2500, 2500, 9, "삭제된보스", HIST_CUT),  # 목록에 없는 보스
+    ])
+    return path
+
+
+def test_empty_window_does_not_leak_views(sample, backend):
+    # 회귀: 기간 안에 행이 없을 때 mmap 을 닫으면서 BufferError 가 나면 안 됨
+    stats = compute_history_stats(sample, 10 ** 10, NAMES)
+    assert stats["rows"] == 0
+    assert stats["bosses"] == {}
+    assert stats["members"] == {}
+
+
+def test_missing_and_empty_file(tmp_path, backend):
+    path = tmp_path / "history.bin"
+    assert compute_history_stats(str(path), 0, NAMES)["rows"] == 0
+    path.write_bytes(b"")
+    assert compute_history_stats(str(path), 0, NAMES)["rows"] == 0
+
+
+def test_stats(sample, backend):
+    stats = compute_history_stats(sample, 1500, NAMES)
+
+    assert stats["rows"] == 6
+    assert stats["truncated"] is False
+
+    b = stats["bosses"]["베지"]
+    assert (b["cut"], b["miss"], b["auto_miss"]) == (3, 0, 1)
+    assert b["miss_rate"] == pytest.approx(0.25)
+    assert b["delay"] == {"median": 300, "p10": 60, "p90": 300, "mean": 180}
+
+    a = stats["bosses"]["악계"]
+    assert (a["cut"], a["miss"], a["auto_miss"], a["delay"]) == (0, 1, 0, None)
+    assert "삭제된보스" not in stats["bosses"]
+
+    assert stats["members"] == {8: 3, 7: 1, 9: 1}
+
+
+def test_stdlib_scan_cap(sample, monkeypatch):
+    monkeypatch.setattr(history, "np", None)
+    monkeypatch.setattr(history, "HISTORY_MAX_SCAN_ROWS", 2)
+    stats = compute_history_stats(sample, 0, NAMES)
+    assert stats["rows"] == 2
+    assert stats["truncated"] is True
+    assert stats["members"] == {8: 1, 9: 1}
+
+
+def test_append_realigns_torn_row(tmp_path, backend):
+    path = str(tmp_path / "history.bin")
+    append_history(path, "베지", HIST_CUT, 100, 40, 5)
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")  # 쓰다 만 행
+    append_history(path, "베지", HIST_MISS, None, 200, 6)
+
+    assert (tmp_path / "history.bin").stat().st_size == 2 * HISTORY_ROW.size
+    stats = compute_history_stats(path, 0, NAMES)
+    b = stats["bosses"]["베지"]
+    assert (b["cut"], b["miss"]) == (1, 1)
+    assert b["delay"]["median"] == 60
+
+
+def test_classify_set():
+    assert classify_set(1000, None) == (HIST_SET, None)         # 미등록 상태에서 등록
+    assert classify_set(1000, 900) == (HIST_SET, 900)           # 젠 이후 컷 입력
+    assert classify_set(1000, 1000) == (HIST_SET, 1000)
+    assert classify_set(1000, 1000 + 6 * 3600) == (HIST_SET_FIX, None)
+
+
+def test_set_correcting_a_clicked_cut_is_not_double_counted(tmp_path, backend):
+    # 21:35 예정 → 21:40 컷 클릭(다음 젠 03:40) → /설정 21:30 으로 정정
+    path = str(tmp_path / "history.bin")
+    due, click, fixed = 77700, 78000, 77400
+    append_history(path, "베지", HIST_CUT, click, due, 7)
+    action, due_ts = classify_set(fixed, click + 6 * 3600)
+    append_history(path, "베지", action, fixed, due_ts, 7)
+
+    b = compute_history_stats(path, 0, NAMES)["bosses"]["베지"]
+    assert b["cut"] == 1
+    assert b["delay"] == {"median": 300, "p10": 300, "p90": 300, "mean": 300}
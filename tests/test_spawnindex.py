@@ -0,0 +1,87 @@
+import random
+
+from spawnindex import SpawnIndex
+
+
+def make(**spawns):
+    idx = SpawnIndex()
+    for name, ns in spawns.items():
+        idx.update(name, ns)
+    return idx
+
+
+def test_update_moves_and_discard_removes():
+    idx = make(a=300, b=100, c=200)
+    assert idx.ordered() == [(100, "b"), (200, "c"), (300, "a")]
+
+    idx.update("b", 400)
+    assert idx.ordered() == [(200, "c"), (300, "a"), (400, "b")]
+
+    idx.update("c", None)  # 미등록으로
+    idx.discard("a")
+    idx.discard("missing")
+    assert idx.ordered() == [(400, "b")]
+    assert len(idx) == 1
+    assert "b" in idx and "a" not in idx and "c" not in idx
+
+
+def test_invalid_spawn_is_not_indexed():
+    idx = make(a=0, b=-5, c=None)
+    assert len(idx) == 0
+
+
+def test_same_time_ties_remove_the_right_entry():
+    idx = make(a=100, b=100, c=100)
+    idx.discard("b")
+    assert idx.ordered() == [(100, "a"), (100, "c")]
+    idx.update("c", 50)
+    assert idx.ordered() == [(50, "c"), (100, "a")]
+
+
+def test_upcoming_starts_at_now_and_overdue_is_separate():
+    idx = make(베지=100, 멘지=300, 부활=500, 각성=900)
+    assert idx.overdue(200) == [(100, "베지")]
+    assert idx.upcoming(200) == [(300, "멘지"), (500, "부활"), (900, "각성")]
+    assert idx.upcoming(200, limit=2) == [(300, "멘지"), (500, "부활")]
+    assert idx.upcoming(1000) == []
+    # now 와 같은 시각은 아직 지나지 않은 것으로 봄
+    assert idx.upcoming(300, limit=1) == [(300, "멘지")]
+    assert idx.overdue(300) == [(100, "베지")]
+
+
+def test_until_is_inclusive_for_any_name():
+    # 한글/보조 평면 문자 이름도 until 경계 시각에 포함되어야 함
+    idx = make(베지=500, **{"\U0001F409": 500, "zz": 501})
+    assert idx.upcoming(0, until=500) == [(500, "베지"), (500, "\U0001F409")]
+    assert idx.upcoming(0, until=499) == []
+    assert idx.upcoming(0, limit=1, until=501) == [(500, "베지")]
+
+
+def test_from_state():
+    state = {"bosses": {"a": {"next_spawn": 20}, "b": {"next_spawn": None}, "c": {"next_spawn": 10}}}
+    assert SpawnIndex.from_state(state).ordered() == [(10, "c"), (20, "a")]
+
+
+def test_matches_sorted_reference():
+    rng = random.Random(0)
+    idx = SpawnIndex()
+    ref = {}
+    for _ in range(5000):
+        name = f"b{rng.randint(0, 40)}"
+        if rng.random() < 0.1:
+            idx.discard(name)
+            ref.pop(name, None)
+            continue
+        ns = rng.choice([None, rng.randint(1, 300)])
+        idx.update(name, ns)
+        if ns is None:
+            ref.pop(name, None)
+        else:
+            ref[name] = ns
+
+    expected = sorted((ns, name) for name, ns in ref.items())
+    assert idx.ordered() == expected
+    now, until = 100, 200
+    assert idx.overdue(now) == [e for e in expected if e[0] < now]
+    assert idx.upcoming(now, until=until) == [e for e in expected if now <= e[0] <= until]
+    assert idx.upcoming(now, limit=3) == [e for e in expected if e[0] >= now][:3]
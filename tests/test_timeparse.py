@@ -0,0 +1,69 @@
+import datetime
+import random
+
+import pytest
+
+from legacy_timeparse import KST, legacy_parse_cut_time_to_ts
+from timeparse import parse_cut_time_to_ts, parse_cut_times_to_ts
+
+
+def kst_ts(y, mo, d, hh, mm, ss=0):
+    return int(KST.localize(datetime.datetime(y, mo, d, hh, mm, ss)).timestamp())
+
+
+# 2026-01-01 00:30:00 KST (연도 경계 바로 뒤)
+NOW = kst_ts(2026, 1, 1, 0, 30)
+
+
+def _random_existing_format(rng):
+    hh, mm, ss = rng.randint(0, 25), rng.randint(0, 61), rng.randint(0, 61)
+    y, mo, d = rng.randint(2020, 2030), rng.randint(0, 13), rng.randint(0, 32)
+    return rng.choice([
+        f"{hh}:{mm:02d}",
+        f"{hh}:{mm}",
+        f"{hh:02d}:{mm:02d}:{ss:02d}",
+        f" {hh:02d}:{mm:02d} ",
+        f"{y}-{mo:02d}-{d:02d} {hh:02d}:{mm:02d}",
+        f"{y}-{mo}-{d} {hh}:{mm}:{ss}",
+    ])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_legacy_parser_on_existing_formats(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        now = rng.randint(kst_ts(2020, 1, 1, 0, 0), kst_ts(2030, 12, 31, 23, 59))
+        text = _random_existing_format(rng)
+        expected = legacy_parse_cut_time_to_ts(text, datetime.datetime.fromtimestamp(now, KST))
+        assert parse_cut_time_to_ts(text, now) == expected, (text, now)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2130", kst_ts(2025, 12, 31, 21, 30)),
+    ("0010", kst_ts(2026, 1, 1, 0, 10)),
+    ("21시30분", kst_ts(2025, 12, 31, 21, 30)),
+    ("21시", kst_ts(2025, 12, 31, 21, 0)),
+    ("0시 5분", kst_ts(2026, 1, 1, 0, 5)),
+    ("10분전", NOW - 10 * 60),
+    ("2시간전", NOW - 2 * 3600),
+    ("1시간 30분 전", NOW - 90 * 60),
+    ("12-31 23:00", kst_ts(2025, 12, 31, 23, 0)),
+    ("01-01 00:10", kst_ts(2026, 1, 1, 0, 10)),
+    ("1-1 01:00", kst_ts(2025, 1, 1, 1, 0)),  # 올해 기준 미래 → 작년
+    ("2026-01-20 09:10", kst_ts(2026, 1, 20, 9, 10)),
+])
+def test_shorthand_formats(text, expected):
+    assert parse_cut_time_to_ts(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text", ["", "전", "0분전", "2460", "2199", "13-01 10:00", "02-30 10:00", "abc", "21:30:00:00"])
+def test_rejects_invalid(text):
+    assert parse_cut_time_to_ts(text, NOW) is None
+
+
+def test_batch_uses_single_now():
+    assert parse_cut_times_to_ts(["10분전", "2130", "xx"], NOW) == [
+        NOW - 600,
+        kst_ts(2025, 12, 31, 21, 30),
+        None,
+    ]
@@ -0,0 +1,90 @@
+"""
+/설정 컷 시간 입력 파서.
+"""
+import datetime
+import re
+import time
+from typing import List, Optional
+
+
+# KST는 1988년 이후 서머타임이 없으므로 고정 오프셋으로 계산(pytz localize 생략)
+KST_OFFSET_SEC = 9 * 3600
+
+_CUT_TIME_RE = re.compile(
+    r"""
+    ^(?:
+        (?:(?P<y>\d{4})-)?(?P<mo>\d{1,2})-(?P<d>\d{1,2})\s+
+        (?P<dh>\d{1,2}):(?P<dm>\d{1,2})(?::(?P<ds>\d{1,2}))?
+      | (?P<h>\d{1,2}):(?P<m>\d{1,2})(?::(?P<s>\d{1,2}))?
+      | (?P<ch>\d{2})(?P<cm>\d{2})
+      | (?P<kh>\d{1,2})\s*시(?:\s*(?P<km>\d{1,2})\s*분)?
+      | (?P<rel>(?:(?P<rh>\d{1,3})\s*시간)?\s*(?:(?P<rm>\d{1,4})\s*분)?)\s*전
+    )$
+    """,
+    re.VERBOSE,
+)
+
+
+def _kst_wall_to_ts(y: int, mo: int, d: int, hh: int, mm: int, ss: int) -> int:
+    # datetime 생성으로 날짜/시각 범위 검증 (잘못된 값이면 ValueError)
+    dt = datetime.datetime(y, mo, d, hh, mm, ss, tzinfo=datetime.timezone.utc)
+    return int(dt.timestamp()) - KST_OFFSET_SEC
+
+
+def parse_cut_time_to_ts(text: str, now: Optional[int] = None) -> Optional[int]:
+    """
+    /설정에서 '컷 시간'으로 쓰는 입력 파서.
+    - 'YYYY-MM-DD HH:MM(:SS)' : 해당 시각(KST)
+    - 'MM-DD HH:MM(:SS)' : 올해 해당 시각(미래면 작년으로 해석)
+    - 'HH:MM(:SS)' / 'HHMM' / 'H시' / 'H시M분' : 가장 최근 발생한 시각(미래면 어제로 해석)
+    - 'N분전' / 'N시간전' / 'N시간M분전' : 현재 기준 상대 시각
+    여러 입력을 한 번에 처리할 때는 now(초)를 넘겨 같은 기준 시각을 공유합니다.
+    """
+    m = _CUT_TIME_RE.match(text.strip())
+    if m is None:
+        return None
+
+    now = now if now is not None else int(time.time())
+    g = m.groupdict()
+
+    try:
+        # 상대 시각: N시간M분전
+        if g["rel"] is not None:
+            delta = int(g["rh"] or 0) * 3600 + int(g["rm"] or 0) * 60
+            if delta <= 0:
+                return None
+            return now - delta
+
+        today = datetime.datetime.fromtimestamp(now + KST_OFFSET_SEC, datetime.timezone.utc)
+
+        # (YYYY-)MM-DD HH:MM(:SS)
+        if g["mo"] is not None:
+            mo, d = int(g["mo"]), int(g["d"])
+            hh, mm, ss = int(g["dh"]), int(g["dm"]), int(g["ds"] or 0)
+            if g["y"] is not None:
+                return _kst_wall_to_ts(int(g["y"]), mo, d, hh, mm, ss)
+            ts = _kst_wall_to_ts(today.year, mo, d, hh, mm, ss)
+            if ts > now:
+                ts = _kst_wall_to_ts(today.year - 1, mo, d, hh, mm, ss)
+            return ts
+
+        # 시각만 입력 -> 가장 최근 발생한 시각
+        if g["h"] is not None:
+            hh, mm, ss = int(g["h"]), int(g["m"]), int(g["s"] or 0)
+        elif g["ch"] is not None:
+            hh, mm, ss = int(g["ch"]), int(g["cm"]), 0
+        else:
+            hh, mm, ss = int(g["kh"]), int(g["km"] or 0), 0
+
+        ts = _kst_wall_to_ts(today.year, today.month, today.day, hh, mm, ss)
+        if ts > now:
+            ts -= 86400
+        return ts
+    except ValueError:
+        return None
+
+
+def parse_cut_times_to_ts(texts: List[str], now: Optional[int] = None) -> List[Optional[int]]:
+    """여러 컷 시간을 같은 기준 시각(now)으로 일괄 파싱합니다."""
+    now = now if now is not None else int(time.time())
+    return [parse_cut_time_to_ts(t, now) for t in texts]